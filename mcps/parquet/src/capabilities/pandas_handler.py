@@ -1,6 +1,16 @@
-import pandas as pd
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
+
+
+# read, filter and convert in one worker call so none of it runs on the event loop
+def _filter_csv(file_path: str, column: str, threshold: int):
+    # imported here so server startup does not pay for pandas
+    import pandas as pd
+
+    df = pd.read_csv(file_path)
+    filtered_df = df[df[column] > threshold]
+
+    # convert filtered dataframe to dict for json response
+    return len(df), len(filtered_df), filtered_df.to_dict(orient="records")
 
 
 # function to analyze csv file asynchronously
@@ -10,24 +20,17 @@ async def analyze_csv(file_path: str, column: str, threshold: int):
     returns: filtered dataframe as dict
     """
     try:
-        # use thread pool for file I/O operations
-        loop = asyncio.get_event_loop()
-        with ThreadPoolExecutor() as pool:
-            df = await loop.run_in_executor(pool, pd.read_csv, file_path)
-
-            filtered_df = await loop.run_in_executor(
-                pool, lambda: df[df[column] > threshold]
-            )
-
-            # convert filtered dataframe to dict for json response
-            result = filtered_df.to_dict(orient="records")
-
-            return {
-                "status": "success",
-                "total_rows": len(df),
-                "filtered_rows": len(filtered_df),
-                "data": result,
-            }
+        # use the shared thread pool for file I/O operations
+        total_rows, filtered_rows, result = await asyncio.to_thread(
+            _filter_csv, file_path, column, threshold
+        )
+
+        return {
+            "status": "success",
+            "total_rows": total_rows,
+            "filtered_rows": filtered_rows,
+            "data": result,
+        }
 
     except Exception as e:
         return {"status": "error", "message": f"error processing csv: {str(e)}"}
@@ -1,7 +1,47 @@
+import functools
+import os
+
 import pyarrow.parquet as pq
 
+# files below this size are read normally; mapping them costs more than it saves
+MMAP_MIN_BYTES = 16 << 20
+
+
+# parse the footer once per file version; keyed by (path, mtime, size) so
+# a rewritten file is picked up on the next call
+@functools.lru_cache(maxsize=int(os.getenv("PARQUET_META_CACHE", "8")))
+def _read_metadata(parquet_file: str, mtime_ns: int, size: int):
+    return pq.read_metadata(parquet_file)
+
+
+# open a parquet file, reusing the cached footer metadata; large files are
+# memory-mapped
+def _open_parquet(parquet_file: str) -> pq.ParquetFile:
+    st = os.stat(parquet_file)
+    metadata = _read_metadata(parquet_file, st.st_mtime_ns, st.st_size)
+    memory_map = st.st_size >= MMAP_MIN_BYTES
+    return pq.ParquetFile(parquet_file, metadata=metadata, memory_map=memory_map)
+
+
+# function to read any specified column, optionally only the first `limit` values
+def read_column(parquet_file: str, column_name: str, limit: int | None = None):
+    # close the file (and any memory map) before returning
+    with _open_parquet(parquet_file) as parquet:
+        if limit is None:
+            table = parquet.read(columns=[column_name])
+            return table.column(column_name).to_pylist()
+
+        # unknown columns raise KeyError on both paths
+        if column_name not in parquet.schema_arrow.names:
+            raise KeyError(column_name)
+        if limit == 0:
+            return []
 
-# function to read any specified column
-def read_column(parquet_file: str, column_name: str):
-    table = pq.read_table(parquet_file, columns=[column_name])
-    return table.column(column_name).to_pylist()
+        # stop once enough rows are read so later row groups are never decoded
+        values = []
+        batches = parquet.iter_batches(batch_size=limit, columns=[column_name])
+        for batch in batches:
+            values.extend(batch.column(column_name).to_pylist())
+            if len(values) >= limit:
+                break
+        return values[:limit]
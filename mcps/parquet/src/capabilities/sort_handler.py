@@ -1,13 +1,17 @@
+# sort key: "date time" prefix of a log line, split only once per line
+def _timestamp_key(line: str):
+    parts = line.split(None, 2)
+    return parts[0] + " " + parts[1]
+
+
 # function to sort log entries by timestamp
 def sort_log_by_timestamp(file_path: str):
     try:
         with open(file_path, "r") as f:
             lines = f.readlines()
 
-        # sort lines based on timestamp
-        sorted_lines = sorted(
-            lines, key=lambda line: line.split()[0] + " " + line.split()[1]
-        )
-        return sorted_lines
+        # sort lines in place based on timestamp
+        lines.sort(key=_timestamp_key)
+        return lines
     except Exception as e:
         return {"error": f"error processing file: {str(e)}"}
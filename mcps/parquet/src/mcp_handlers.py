@@ -1,8 +1,14 @@
 from fastapi import HTTPException
+import asyncio
 import os
 from capabilities.parquet_handler import read_column
 from capabilities.sort_handler import sort_log_by_timestamp
-from capabilities.compression_handler import compress_file
+from capabilities.compression_handler import (
+    DEFAULT_COMPRESSLEVEL,
+    MAX_COMPRESSLEVEL,
+    MIN_COMPRESSLEVEL,
+    compress_file,
+)
 from capabilities.pandas_handler import analyze_csv
 
 # available resources
@@ -46,12 +52,15 @@ resources = [
     },
 ]
 
+# resources indexed by id for constant-time lookup in get_resource
+resources_by_id = {r["id"]: r for r in resources}
+
 tools = [
     {
         "id": "tool1",
         "name": "Parquet Reader",
         "description": "Reads columns from Parquet files",
-        "usage": "'tool': 'parquet', 'file': 'filename (optional)', 'column': 'column_name' in params.",
+        "usage": "'tool': 'parquet', 'file': 'filename (optional)', 'column': 'column_name', 'limit': max_rows (optional) in params.",
     },
     {
         "id": "tool2",
@@ -63,7 +72,7 @@ tools = [
         "id": "tool3",
         "name": "Compression Tool",
         "description": "Compresses files using gzip",
-        "usage": "'tool': 'compress', 'file': 'filename' in params.",
+        "usage": "'tool': 'compress', 'file': 'filename', 'level': 0-9 (optional, default 6; 0 stores uncompressed) in params.",
     },
     {
         "id": "tool4",
@@ -74,6 +83,36 @@ tools = [
 ]
 
 
+# a row limit must be a non-negative int; bool is an int subclass, so it is
+# excluded by the exact type check
+def _valid_limit(limit):
+    return limit is None or (type(limit) is int and limit >= 0)
+
+
+# a gzip level must be an int from 0 to 9, with the same exact type check
+def _valid_level(level):
+    return type(level) is int and MIN_COMPRESSLEVEL <= level <= MAX_COMPRESSLEVEL
+
+
+# raised by a tool runner when a call param has an unusable value
+class InvalidParams(ValueError):
+    pass
+
+
+# build a JSON-RPC success response
+def _result(result, request_id):
+    return {"jsonrpc": "2.0", "result": result, "id": request_id}
+
+
+# build a JSON-RPC error response
+def _error(code, message, request_id):
+    return {
+        "jsonrpc": "2.0",
+        "error": {"code": code, "message": message},
+        "id": request_id,
+    }
+
+
 # handle mcp request
 async def handle_mcp_request(data):
     if "jsonrpc" not in data or "method" not in data:
@@ -96,85 +135,97 @@ async def handle_mcp_request(data):
 
 # list available resources with detailed information
 def list_resources(id):
-    return {"jsonrpc": "2.0", "result": resources, "id": id}
+    return _result(resources, id)
 
 
 # get specific resource by id
 def get_resource(params, request_id):
     resource_id = params.get("id")
     if not resource_id:
-        return {
-            "jsonrpc": "2.0",
-            "error": {"code": -32602, "message": "Resource ID not provided"},
-            "id": request_id,
-        }
+        return _error(-32602, "Resource ID not provided", request_id)
 
-    resource = next((r for r in resources if r["id"] == resource_id), None)
+    resource = resources_by_id.get(resource_id)
     if not resource:
-        return {
-            "jsonrpc": "2.0",
-            "error": {"code": -32601, "message": f"Resource {resource_id} not found"},
-            "id": request_id,
-        }
+        return _error(-32601, f"Resource {resource_id} not found", request_id)
 
-    return {"jsonrpc": "2.0", "result": resource, "id": request_id}
+    return _result(resource, request_id)
 
 
 # list of available tools
 def list_tools(id):
-    return {"jsonrpc": "2.0", "result": tools, "id": id}
+    return _result(tools, id)
 
 
-# execute tool based on id
-async def call_tool(params, request_id):
-    tool = params.get("tool")
-    if not tool:
-        return {
-            "jsonrpc": "2.0",
-            "error": {"code": -32602, "message": "Invalid params"},
-            "id": request_id,
-        }
+# tool runners take the call params and return the tool result; blocking
+# file work runs in a worker thread so the event loop keeps serving requests
+async def _run_parquet(params):
+    file = params.get("file", "weather_data.parquet")
+    column = params.get("column")
+    limit = params.get("limit")
+    if not _valid_limit(limit):
+        raise InvalidParams("'limit' must be a non-negative integer")
 
-    if tool == "parquet":
-        file = params.get("file", "weather_data.parquet")
-        column = params.get("column")
+    filepath = os.path.join("data", file)
 
-        filepath = os.path.join("data", file)
+    # read column data from parquet file
+    return await asyncio.to_thread(read_column, filepath, column, limit)
 
-        # read column data from parquet file
-        result = read_column(filepath, column)
-        return {"jsonrpc": "2.0", "id": request_id, "result": result}
 
-    elif tool == "sort":
-        file = params.get("file", "huge_log.txt")
-        filepath = os.path.join("data", file)
+async def _run_sort(params):
+    file = params.get("file", "huge_log.txt")
+    filepath = os.path.join("data", file)
 
-        # sort log file by timestamp
-        result = sort_log_by_timestamp(filepath)
-        return {"jsonrpc": "2.0", "id": request_id, "result": result}
+    # sort log file by timestamp
+    return await asyncio.to_thread(sort_log_by_timestamp, filepath)
 
-    elif tool == "compress":
-        file = params.get("file", "output.log")
-        filepath = os.path.join("data", file)
 
-        # compress file using gzip
-        result = compress_file(filepath)
-        return {"jsonrpc": "2.0", "id": request_id, "result": result}
+async def _run_compress(params):
+    file = params.get("file", "output.log")
+    level = params.get("level", DEFAULT_COMPRESSLEVEL)
+    if not _valid_level(level):
+        raise InvalidParams(
+            f"'level' must be an integer from {MIN_COMPRESSLEVEL} to {MAX_COMPRESSLEVEL}"
+        )
 
-    elif tool == "pandas":
-        file = params.get("file", "data.csv")
-        column = params.get("column", "marks")
-        threshold = params.get("threshold", 50)
+    filepath = os.path.join("data", file)
 
-        filepath = os.path.join("data", file)
+    # compress file using gzip
+    return await asyncio.to_thread(compress_file, filepath, level)
 
-        # analyze csv data using pandas (async)
-        result = await analyze_csv(filepath, column, threshold)
-        return {"jsonrpc": "2.0", "id": request_id, "result": result}
 
-    else:
-        return {
-            "jsonrpc": "2.0",
-            "error": {"code": -32601, "message": "Tool not found"},
-            "id": request_id,
-        }
+async def _run_pandas(params):
+    file = params.get("file", "data.csv")
+    column = params.get("column", "marks")
+    threshold = params.get("threshold", 50)
+
+    filepath = os.path.join("data", file)
+
+    # analyze csv data using pandas (async)
+    return await analyze_csv(filepath, column, threshold)
+
+
+tool_runners = {
+    "parquet": _run_parquet,
+    "sort": _run_sort,
+    "compress": _run_compress,
+    "pandas": _run_pandas,
+}
+
+
+# execute tool based on id
+async def call_tool(params, request_id):
+    tool = params.get("tool")
+    if not tool:
+        return _error(-32602, "Invalid params", request_id)
+
+    # non-string ids (e.g. a JSON list) are unhashable and can never match
+    runner = tool_runners.get(tool) if isinstance(tool, str) else None
+    if runner is None:
+        return _error(-32601, "Tool not found", request_id)
+
+    try:
+        result = await runner(params)
+    except InvalidParams as e:
+        return _error(-32602, f"Invalid params: {e}", request_id)
+
+    return _result(result, request_id)
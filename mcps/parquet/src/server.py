@@ -1,13 +1,46 @@
-from fastapi import FastAPI, Request
+import os
+
+import orjson
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
 from mcp_handlers import handle_mcp_request
 
 app = FastAPI()
 
+# largest JSON-RPC request body accepted by the endpoint
+MAX_REQUEST_BYTES = int(os.getenv("MCP_MAX_REQUEST_BYTES", str(1 << 20)))
+
+
+# compact orjson response; values orjson cannot encode natively (e.g. pandas
+# Timestamps from parquet columns) fall back to FastAPI's encoder. Named apart
+# from FastAPI's own (deprecated) ORJSONResponse, which has no such fallback
+class MCPJSONResponse(JSONResponse):
+    def render(self, content) -> bytes:
+        return orjson.dumps(
+            content,
+            default=jsonable_encoder,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+        )
+
 
 @app.post("/mcp")
 async def mcp_endpoint(request: Request):
-    data = await request.json()
-    return await handle_mcp_request(data)
+    # refuse oversized bodies from the declared length, before reading them
+    content_length = request.headers.get("content-length", "")
+    if content_length.isdigit() and int(content_length) > MAX_REQUEST_BYTES:
+        raise HTTPException(status_code=413, detail="Request body too large")
+
+    # chunked bodies declare no length, so also enforce the limit while reading
+    body = bytearray()
+    async for chunk in request.stream():
+        body += chunk
+        if len(body) > MAX_REQUEST_BYTES:
+            raise HTTPException(status_code=413, detail="Request body too large")
+
+    data = orjson.loads(body)
+    # returning the response directly skips FastAPI's per-value encoding pass
+    return MCPJSONResponse(await handle_mcp_request(data))
 
 
 def main():
@@ -0,0 +1,43 @@
+"""
+Test configuration for Parquet MCP tests.
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+# Add src to Python path, once for all test modules
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+# RAM-backed root for pytest's temporary files
+SHM_DIR = Path("/dev/shm")
+
+# basetemp created by this conftest, removed again when the run passes
+_shm_basetemp = pytest.StashKey[str]()
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config):
+    # keep tmp_path files in memory on Linux; an explicit --basetemp wins
+    if config.option.basetemp or not SHM_DIR.is_dir():
+        return
+    if not os.access(SHM_DIR, os.W_OK):
+        return
+    # a fresh directory per run, since pytest empties basetemp on start and
+    # concurrent runs must not share one
+    basetemp = tempfile.mkdtemp(dir=SHM_DIR, prefix="parquet-mcp-pytest-")
+    config.option.basetemp = basetemp
+    config.stash[_shm_basetemp] = basetemp
+
+
+def pytest_sessionfinish(session, exitstatus):
+    # free the memory held by a passing run's files; a failing or interrupted
+    # run keeps them under /dev/shm/parquet-mcp-pytest-* for inspection
+    basetemp = session.config.stash.get(_shm_basetemp, None)
+    if basetemp and exitstatus == pytest.ExitCode.OK:
+        shutil.rmtree(basetemp, ignore_errors=True)
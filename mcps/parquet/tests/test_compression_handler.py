@@ -1,16 +1,14 @@
 import pytest
 import os
-import tempfile
 from src.capabilities.compression_handler import compress_file
 
 
 @pytest.fixture
-def sample_file():
+def sample_file(tmp_path):
     # create a temporary file with some content
-    with tempfile.NamedTemporaryFile(mode="w", delete=False) as f:
-        f.write("test content\n" * 100)
-    yield f.name
-    os.unlink(f.name)
+    path = tmp_path / "sample.txt"
+    path.write_text("test content\n" * 100)
+    return str(path)
 
 
 # test successful compression of a file
@@ -19,7 +17,15 @@ def test_compress_success(sample_file):
     assert isinstance(result, dict)
     assert result["status"] == "success"
     assert os.path.exists(result["compressed_file"])
-    os.unlink(result["compressed_file"])
+
+
+# test an out-of-range level is rejected without writing an output file
+@pytest.mark.parametrize("level", [10, -1, "fast", 1.0, True])
+def test_compress_invalid_level(sample_file, level):
+    result = compress_file(sample_file, level)
+    assert result["status"] == "error"
+    assert "invalid compression level" in result["message"]
+    assert not os.path.exists(sample_file + ".gz")
 
 
 # test compression of non-existent file
@@ -31,13 +37,10 @@ def test_compress_nonexistent_file():
 
 
 # test compression of empty file
-def test_compress_empty_file():
-    with tempfile.NamedTemporaryFile(mode="w", delete=False) as f:
-        f.write("")
-    try:
-        result = compress_file(f.name)
-        assert isinstance(result, dict)
-        assert result["status"] == "error"
-        assert "compression failed" in result["message"].lower()
-    finally:
-        os.unlink(f.name)
+def test_compress_empty_file(tmp_path):
+    path = tmp_path / "empty.txt"
+    path.write_text("")
+    result = compress_file(str(path))
+    assert isinstance(result, dict)
+    assert result["status"] == "error"
+    assert "compression failed" in result["message"].lower()
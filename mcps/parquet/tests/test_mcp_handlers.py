@@ -9,8 +9,16 @@ from src.mcp_handlers import (
     call_tool,
     resources,
     tools,
+    tool_runners,
 )
 
+# keys every resource and tool entry must carry
+RESOURCE_KEYS = frozenset({"id", "name", "type", "description", "path", "format"})
+TOOL_KEYS = frozenset({"id", "name", "description", "usage"})
+
+# tool names call_tool must dispatch
+EXPECTED_TOOLS = frozenset({"parquet", "sort", "compress", "pandas"})
+
 
 class TestMCPHandlers:
     @pytest.mark.asyncio
@@ -135,40 +143,44 @@ class TestMCPHandlers:
         assert result["error"]["code"] == -32602
 
     @pytest.mark.asyncio
-    async def test_call_tool_parquet(self):
-        # Test parquet tool
-        with patch("src.mcp_handlers.read_column") as mock_read:
-            mock_read.return_value = {"status": "success", "data": ["col1", "col2"]}
-            result = await call_tool({"tool": "parquet", "column": "temperature"}, 7)
+    @pytest.mark.parametrize(
+        "target, params, request_id",
+        [
+            ("read_column", {"tool": "parquet", "column": "temperature"}, 7),
+            ("sort_log_by_timestamp", {"tool": "sort", "file": "test.log"}, 8),
+            ("compress_file", {"tool": "compress", "file": "test.txt"}, 9),
+        ],
+        ids=["parquet", "sort", "compress"],
+    )
+    async def test_call_tool_file_tools(self, target, params, request_id):
+        # Test parquet, sort and compress tools dispatch to their capability
+        with patch(f"src.mcp_handlers.{target}") as mock_tool:
+            mock_tool.return_value = {"status": "success"}
+            result = await call_tool(params, request_id)
             assert result["jsonrpc"] == "2.0"
-            assert result["id"] == 7
-            assert "result" in result
-            mock_read.assert_called_once()
+            assert result["id"] == request_id
+            assert result["result"] == {"status": "success"}
+            mock_tool.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_call_tool_sort(self):
-        # Test sort tool
-        with patch("src.mcp_handlers.sort_log_by_timestamp") as mock_sort:
-            mock_sort.return_value = {"status": "success", "sorted_entries": 100}
-            result = await call_tool({"tool": "sort", "file": "test.log"}, 8)
-            assert result["jsonrpc"] == "2.0"
-            assert result["id"] == 8
-            assert "result" in result
-            mock_sort.assert_called_once()
+    async def test_call_tool_compress_level(self):
+        # Test compress tool forwards the requested gzip level
+        with patch("src.mcp_handlers.compress_file") as mock_compress:
+            mock_compress.return_value = {"status": "success"}
+            await call_tool({"tool": "compress", "file": "test.txt", "level": 1}, 19)
+            mock_compress.assert_called_once_with("data/test.txt", 1)
 
     @pytest.mark.asyncio
-    async def test_call_tool_compress(self):
-        # Test compress tool
+    @pytest.mark.parametrize("level", [True, 10, "6"])
+    async def test_call_tool_compress_invalid_level(self, level):
+        # Test an unusable gzip level is rejected before compressing
         with patch("src.mcp_handlers.compress_file") as mock_compress:
-            mock_compress.return_value = {
-                "status": "success",
-                "compressed_file": "test.gz",
-            }
-            result = await call_tool({"tool": "compress", "file": "test.txt"}, 9)
-            assert result["jsonrpc"] == "2.0"
-            assert result["id"] == 9
-            assert "result" in result
-            mock_compress.assert_called_once()
+            params = {"tool": "compress", "file": "test.txt", "level": level}
+            result = await call_tool(params, 22)
+            assert result["id"] == 22
+            assert result["error"]["code"] == -32602
+            assert "level" in result["error"]["message"]
+            mock_compress.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_call_tool_pandas(self):
@@ -208,6 +220,13 @@ class TestMCPHandlers:
         assert "error" in result
         assert result["error"]["code"] == -32601
 
+    @pytest.mark.asyncio
+    async def test_call_tool_non_string_tool(self):
+        # Test non-string tool id is reported as not found
+        result = await call_tool({"tool": ["parquet"]}, 18)
+        assert result["id"] == 18
+        assert result["error"]["code"] == -32601
+
     @pytest.mark.asyncio
     async def test_call_tool_parquet_default_file(self):
         # Test parquet tool with default file
@@ -215,9 +234,33 @@ class TestMCPHandlers:
             mock_read.return_value = {"status": "success"}
             await call_tool({"tool": "parquet", "column": "temperature"}, 13)
             mock_read.assert_called_once_with(
-                "data/weather_data.parquet", "temperature"
+                "data/weather_data.parquet", "temperature", None
+            )
+
+    @pytest.mark.asyncio
+    async def test_call_tool_parquet_limit(self):
+        # Test parquet tool forwards the requested row limit
+        with patch("src.mcp_handlers.read_column") as mock_read:
+            mock_read.return_value = [1, 2]
+            params = {"tool": "parquet", "column": "temperature", "limit": 2}
+            result = await call_tool(params, 20)
+            assert result["result"] == [1, 2]
+            mock_read.assert_called_once_with(
+                "data/weather_data.parquet", "temperature", 2
             )
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("limit", [-1, "5", 2.5, True])
+    async def test_call_tool_parquet_invalid_limit(self, limit):
+        # Test an unusable row limit is rejected before any read
+        with patch("src.mcp_handlers.read_column") as mock_read:
+            params = {"tool": "parquet", "column": "temperature", "limit": limit}
+            result = await call_tool(params, 21)
+            assert result["id"] == 21
+            assert result["error"]["code"] == -32602
+            assert "limit" in result["error"]["message"]
+            mock_read.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_call_tool_sort_default_file(self):
         # Test sort tool with default file
@@ -232,27 +275,24 @@ class TestMCPHandlers:
         with patch("src.mcp_handlers.compress_file") as mock_compress:
             mock_compress.return_value = {"status": "success"}
             await call_tool({"tool": "compress"}, 15)
-            mock_compress.assert_called_once_with("data/output.log")
+            mock_compress.assert_called_once_with("data/output.log", 6)
 
     def test_resources_structure(self):
         # Test resources structure and content
         assert len(resources) == 4
         for resource in resources:
-            assert "id" in resource
-            assert "name" in resource
-            assert "type" in resource
-            assert "description" in resource
-            assert "path" in resource
-            assert "format" in resource
+            assert RESOURCE_KEYS <= resource.keys()
 
     def test_tools_structure(self):
         # Test tools structure and content
         assert len(tools) == 4
         for tool in tools:
-            assert "id" in tool
-            assert "name" in tool
-            assert "description" in tool
-            assert "usage" in tool
+            assert TOOL_KEYS <= tool.keys()
+
+    def test_tool_runners_registered(self):
+        # Test every expected tool has a runner, listing all missing ones at once
+        missing = EXPECTED_TOOLS - tool_runners.keys()
+        assert not missing, f"missing tools: {sorted(missing)}"
 
     @pytest.mark.asyncio
     async def test_handle_mcp_request_with_params(self):
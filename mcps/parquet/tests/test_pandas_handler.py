@@ -1,19 +1,14 @@
 import pytest
-import os
-import tempfile
 from src.capabilities.pandas_handler import analyze_csv
 
 
-@pytest.fixture
-def sample_csv_file():
+# written once per session; tests only read it
+@pytest.fixture(scope="session")
+def sample_csv_file(tmp_path_factory):
     # create a temporary csv file
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".csv") as f:
-        f.write("id,score\n")
-        f.write("1,85\n")
-        f.write("2,92\n")
-        f.write("3,78\n")
-    yield f.name
-    os.unlink(f.name)
+    path = tmp_path_factory.mktemp("csv") / "sample.csv"
+    path.write_text("id,score\n1,85\n2,92\n3,78\n")
+    return str(path)
 
 
 # test successful analysis of csv data
@@ -25,6 +20,34 @@ async def test_analyze_success(sample_csv_file):
     assert len(result["data"]) == 2
 
 
+# test date and time columns come back as the raw csv text
+@pytest.mark.asyncio
+async def test_analyze_keeps_temporal_text(tmp_path):
+    path = tmp_path / "events.csv"
+    path.write_text(
+        "ts,iso,utc,day,at,a,a,score\n"
+        "2024-01-02 10:00:00,2024-01-02T10:00:00,2024-01-02T10:00:00Z,"
+        "2024-01-02,10:00:00,1,2,85\n"
+        "2024-01-03 11:00:00,2024-01-03T11:00:00,2024-01-03T11:00:00Z,"
+        "2024-01-03,11:00:00,3,4,70\n"
+    )
+    result = await analyze_csv(str(path), "score", 80)
+    assert result["status"] == "success"
+    # timestamps keep their text and duplicate headers are renamed, not dropped
+    assert result["data"] == [
+        {
+            "ts": "2024-01-02 10:00:00",
+            "iso": "2024-01-02T10:00:00",
+            "utc": "2024-01-02T10:00:00Z",
+            "day": "2024-01-02",
+            "at": "10:00:00",
+            "a": 1,
+            "a.1": 2,
+            "score": 85,
+        }
+    ]
+
+
 # test analysis with non-existent file
 @pytest.mark.asyncio
 async def test_analyze_nonexistent_file():
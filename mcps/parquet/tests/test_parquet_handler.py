@@ -1,13 +1,25 @@
 import pytest
 import pyarrow as pa
 import pyarrow.parquet as pq
-import os
-import tempfile
+from src.capabilities import parquet_handler
 from src.capabilities.parquet_handler import read_column
 
+# codecs to exercise; ones this pyarrow build lacks are skipped, not failed
+CODECS = [
+    pytest.param(
+        codec,
+        marks=pytest.mark.skipif(
+            not pa.Codec.is_available(codec), reason=f"{codec} not available"
+        ),
+    )
+    for codec in ["snappy", "gzip", "lz4", "zstd", "brotli"]
+]
 
-@pytest.fixture
-def sample_parquet_file():
+
+# sample table built once per session; arrow tables are immutable so sharing
+# it across tests is safe
+@pytest.fixture(scope="session")
+def sample_table():
     # create sample data
     data = {
         "id": [1, 2, 3, 4, 5],
@@ -15,12 +27,16 @@ def sample_parquet_file():
         "score": [85, 92, 78, 95, 88],
     }
     # create arrow table
-    table = pa.Table.from_pydict(data)
-    # create temporary parquet file
-    with tempfile.NamedTemporaryFile(suffix=".parquet", delete=False) as f:
-        pq.write_table(table, f.name)
-    yield f.name
-    os.unlink(f.name)
+    return pa.Table.from_pydict(data)
+
+
+# every test using the sample file runs once per codec so each decode path
+# is exercised; each file is written once per session and only read by tests
+@pytest.fixture(scope="session", params=CODECS)
+def sample_parquet_file(request, sample_table, tmp_path_factory):
+    path = tmp_path_factory.mktemp("parquet") / f"sample_{request.param}.parquet"
+    pq.write_table(sample_table, path, compression=request.param)
+    return str(path)
 
 
 # test successful reading of an existing column
@@ -42,3 +58,49 @@ def test_read_nonexistent_column(sample_parquet_file):
 def test_read_nonexistent_file():
     with pytest.raises(FileNotFoundError):
         read_column("nonexistent_file.parquet", "score")
+
+
+# test that a rewritten file is not served from stale cached metadata; uses
+# its own copy since the shared sample file must stay unchanged
+def test_read_column_after_rewrite(sample_table, tmp_path):
+    path = str(tmp_path / "rewrite.parquet")
+    pq.write_table(sample_table, path)
+    assert len(read_column(path, "score")) == 5
+    pq.write_table(pa.Table.from_pydict({"score": [1, 2, 3]}), path)
+    assert read_column(path, "score") == [1, 2, 3]
+
+
+# test reading only the first rows of a column
+def test_read_column_with_limit(sample_parquet_file):
+    assert read_column(sample_parquet_file, "score", limit=2) == [85, 92]
+    assert read_column(sample_parquet_file, "score", limit=10) == [85, 92, 78, 95, 88]
+    assert read_column(sample_parquet_file, "score", limit=0) == []
+
+
+# test the memory-mapped read path used for large files
+def test_read_column_memory_mapped(sample_parquet_file, monkeypatch):
+    monkeypatch.setattr(parquet_handler, "MMAP_MIN_BYTES", 0)
+    assert read_column(sample_parquet_file, "score") == [85, 92, 78, 95, 88]
+
+
+# test the reader is closed once the column is read, including after a limit
+@pytest.mark.parametrize("limit", [None, 1])
+def test_read_column_closes_file(sample_parquet_file, monkeypatch, limit):
+    opened = []
+    open_parquet = parquet_handler._open_parquet
+
+    def tracking_open(path):
+        opened.append(open_parquet(path))
+        return opened[-1]
+
+    monkeypatch.setattr(parquet_handler, "MMAP_MIN_BYTES", 0)
+    monkeypatch.setattr(parquet_handler, "_open_parquet", tracking_open)
+    read_column(sample_parquet_file, "score", limit=limit)
+    assert len(opened) == 1
+    assert opened[0].closed
+
+
+# test an unknown column raises KeyError when a limit is given too
+def test_read_nonexistent_column_with_limit(sample_parquet_file):
+    with pytest.raises(KeyError):
+        read_column(sample_parquet_file, "nonexistent_column", limit=2)
@@ -4,11 +4,13 @@ from src.server import app, main
 from unittest.mock import patch
 
 
-class TestParquetServer:
-    @pytest.fixture
-    def client(self):
-        return TestClient(app)
+# one client for the whole module; it holds no per-test state
+@pytest.fixture(scope="module")
+def client():
+    return TestClient(app)
+
 
+class TestParquetServer:
     def test_mcp_endpoint_valid_request(self, client):
         # Test valid MCP request
         test_data = {"jsonrpc": "2.0", "method": "mcp/listResources", "id": 1}
@@ -46,6 +48,24 @@ class TestParquetServer:
         response = client.post("/mcp", json=test_data)
         assert response.status_code == 200
 
+    @patch("src.server.handle_mcp_request")
+    def test_mcp_endpoint_serializes_column_values(self, mock_handler, client):
+        # Test values orjson cannot encode natively fall back to FastAPI's encoder
+        import numpy as np
+        import pandas as pd
+
+        mock_handler.return_value = {
+            "jsonrpc": "2.0",
+            "result": [pd.Timestamp("2023-01-01 01:00:00"), np.float64(1.5)],
+            "id": 1,
+        }
+
+        test_data = {"jsonrpc": "2.0", "method": "mcp/callTool", "id": 1}
+
+        response = client.post("/mcp", json=test_data)
+        assert response.status_code == 200
+        assert response.json()["result"] == ["2023-01-01T01:00:00", 1.5]
+
     def test_mcp_endpoint_invalid_json(self, client):
         # Test invalid JSON handling - this tests FastAPI's built-in JSON parsing
         import pytest
@@ -57,6 +77,28 @@ class TestParquetServer:
                 headers={"content-type": "application/json"},
             )
 
+    def test_mcp_endpoint_oversized_request(self, client):
+        # Test oversized bodies are rejected before parsing
+        from src.server import MAX_REQUEST_BYTES
+
+        response = client.post(
+            "/mcp",
+            content=b"x" * (MAX_REQUEST_BYTES + 1),
+            headers={"content-type": "application/json"},
+        )
+        assert response.status_code == 413
+
+    def test_mcp_endpoint_oversized_chunked_request(self, client, monkeypatch):
+        # Test chunked bodies, which declare no length, are still capped
+        monkeypatch.setattr("src.server.MAX_REQUEST_BYTES", 100)
+
+        response = client.post(
+            "/mcp",
+            content=iter([b" " * 50] * 100),
+            headers={"content-type": "application/json"},
+        )
+        assert response.status_code == 413
+
     def test_mcp_endpoint_empty_request(self, client):
         # Test empty request
         response = client.post("/mcp", json={})
@@ -75,19 +117,13 @@ class TestParquetServer:
         assert app is not None
         assert hasattr(app, "routes")
 
-    def test_mcp_endpoint_multiple_methods(self, client):
+    # methods that don't need params
+    @pytest.mark.parametrize("method", ["mcp/listResources", "mcp/listTools"])
+    def test_mcp_endpoint_multiple_methods(self, client, method):
         # Test different MCP methods
-        methods = [
-            "mcp/listResources",
-            "mcp/listTools",
-            "mcp/getResource",
-            "mcp/callTool",
-        ]
-
-        for method in methods[:2]:  # Test first two that don't need params
-            test_data = {"jsonrpc": "2.0", "method": method, "id": 1}
-            response = client.post("/mcp", json=test_data)
-            assert response.status_code == 200
+        test_data = {"jsonrpc": "2.0", "method": method, "id": 1}
+        response = client.post("/mcp", json=test_data)
+        assert response.status_code == 200
 
     def test_mcp_endpoint_with_params(self, client):
         # Test MCP requests with parameters
@@ -1,22 +1,19 @@
 import pytest
-import os
-import tempfile
 from src.capabilities.sort_handler import sort_log_by_timestamp
 
 
 # fixture to create a temporary log file with test data
 @pytest.fixture
-def sample_log_file():
-    # create a temporary file
-    with tempfile.NamedTemporaryFile(mode="w", delete=False) as f:
-        # write sample log entries
-        f.write("2024-03-15 10:30:45 INFO test message 1\n")
-        f.write("2024-03-15 09:15:30 ERROR error message\n")
-        f.write("2024-03-15 11:45:20 DEBUG debug message\n")
-        f.write("2024-03-15 10:00:00 INFO test message 2\n")
-
-    yield f.name
-    os.unlink(f.name)
+def sample_log_file(tmp_path):
+    # create a temporary file with sample log entries
+    path = tmp_path / "sample.log"
+    path.write_text(
+        "2024-03-15 10:30:45 INFO test message 1\n"
+        "2024-03-15 09:15:30 ERROR error message\n"
+        "2024-03-15 11:45:20 DEBUG debug message\n"
+        "2024-03-15 10:00:00 INFO test message 2\n"
+    )
+    return str(path)
 
 
 # test successful sorting of log file
@@ -31,16 +28,13 @@ def test_sort_log_success(sample_log_file):
 
 
 # test empty file handling
-def test_sort_empty_file():
-    with tempfile.NamedTemporaryFile(mode="w", delete=False) as f:
-        pass
-
-    try:
-        result = sort_log_by_timestamp(f.name)
-        assert isinstance(result, list)
-        assert len(result) == 0
-    finally:
-        os.unlink(f.name)
+def test_sort_empty_file(tmp_path):
+    path = tmp_path / "empty.log"
+    path.write_text("")
+
+    result = sort_log_by_timestamp(str(path))
+    assert isinstance(result, list)
+    assert len(result) == 0
 
 
 # test non-existent file